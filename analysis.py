@@ -5,28 +5,80 @@ Compares ADP and Amazon break records and returns matched/discrepancy data.
 
 import pandas as pd
 import numpy as np
+import functools
+import os
 import re
-from datetime import datetime
+from collections import defaultdict
 from io import BytesIO
+from pathlib import Path
 
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
+# python-calamine (Rust) reads .xlsx far faster and lighter than openpyxl;
+# fall back to openpyxl on deployments where it is not installed.
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
+
+# -----------------------------------------------------------------
+# PARSED-FILE CACHE
+# -----------------------------------------------------------------
+
+def cache_df(parser):
+    """Memoise a workbook parser on the file's bytes.
+
+    The last few parsed frames are kept in process, so re-running with one
+    of the two uploads unchanged skips parsing that file. Accepts a path or
+    a binary file object, like pd.read_excel.
+    """
+
+    @functools.lru_cache(maxsize=8)
+    def _parse(data: bytes) -> pd.DataFrame:
+        return parser(BytesIO(data))
+
+    @functools.wraps(parser)
+    def wrapper(file) -> pd.DataFrame:
+        if isinstance(file, (str, os.PathLike)):
+            data = Path(file).read_bytes()
+        else:
+            file.seek(0)
+            data = file.read()
+        return _parse(data).copy()
+
+    return wrapper
+
 
 # -----------------------------------------------------------------
 # ADP PARSER
 # -----------------------------------------------------------------
 
+def _to_datetime(col: pd.Series) -> pd.Series:
+    """Parse a column of Excel cells to datetime64 (NaT when unparseable)."""
+    out = pd.to_datetime(col, errors="coerce")
+    # Bare times and odd string formats fail the bulk parse; retry just those
+    # cells from their text.
+    retry = out.isna() & col.notna()
+    if retry.any():
+        out[retry] = pd.to_datetime(col[retry].astype(str), errors="coerce", format="mixed")
+    return out
+
+
+@cache_df
 def parse_adp(file) -> pd.DataFrame:
-    raw = pd.read_excel(file, sheet_name=0, header=None)
+    raw = pd.read_excel(file, sheet_name=0, header=None, engine=EXCEL_ENGINE)
 
-    # Dynamically find the header row (contains "Time In")
+    # Dynamically find the header row (contains "Time In"), then keep only the
+    # name (0), time in (5) and time out (6) columns below it.
     header_row = next(
         (i for i, row in raw.iterrows() if any("Time In" in str(v) for v in row)),
         2,
     )
-    data = raw.iloc[header_row + 1:].copy()
+    data = raw.iloc[header_row + 1:].reindex(columns=[0, 5, 6])
     data[0] = data[0].replace("", np.nan).ffill()
 
     # Drop totals and blanks
@@ -34,54 +86,40 @@ def parse_adp(file) -> pd.DataFrame:
     data = data[~data[0].astype(str).str.strip().str.lower().str.startswith("total")]
     data = data[data[5].notna() & data[6].notna()]
 
-    def to_time(val):
-        if pd.isna(val):
-            return None
-        if isinstance(val, datetime):
-            return val
-        try:
-            return pd.to_datetime(str(val))
-        except Exception:
-            return None
-
-    data["time_in"] = data[5].apply(to_time)
-    data["time_out"] = data[6].apply(to_time)
+    data["time_in"] = _to_datetime(data[5])
+    data["time_out"] = _to_datetime(data[6])
     data["emp_name"] = data[0].astype(str).str.strip()
 
-    records = []
-    for emp, grp in data.groupby("emp_name", sort=False):
-        grp = grp.sort_values("time_in").reset_index(drop=True)
-        break_min, b_start, b_end = None, None, None
-        if len(grp) >= 2:
-            first_out = grp.iloc[0]["time_out"]
-            second_in = grp.iloc[1]["time_in"]
-            if (
-                first_out is not None
-                and second_in is not None
-                and pd.notna(first_out)
-                and pd.notna(second_in)
-            ):
-                delta = (second_in - first_out).total_seconds() / 60
-                if 0 < delta < 120:
-                    break_min = round(delta, 1)
-                    b_start, b_end = first_out, second_in
-        records.append(
-            {
-                "adp_name": emp,
-                "adp_break_start": b_start,
-                "adp_break_end": b_end,
-                "adp_break_minutes": break_min,
-            }
-        )
-    return pd.DataFrame(records)
+    # The break is the gap between an employee's first punch-out and the
+    # punch-in that follows it once their rows are ordered by time in.
+    emp_order = data["emp_name"].unique()
+    data = data.sort_values(["emp_name", "time_in"], kind="stable")
+    data["next_in"] = data.groupby("emp_name", sort=False)["time_in"].shift(-1)
+    first = (
+        data.drop_duplicates("emp_name", keep="first")
+        .set_index("emp_name")
+        .reindex(emp_order)
+    )
+    delta = (first["next_in"] - first["time_out"]).dt.total_seconds() / 60
+    valid = (delta > 0) & (delta < 120)
+
+    return pd.DataFrame(
+        {
+            "adp_name": emp_order,
+            "adp_break_start": first["time_out"].where(valid).to_numpy(),
+            "adp_break_end": first["next_in"].where(valid).to_numpy(),
+            "adp_break_minutes": delta.where(valid).round(1).to_numpy(),
+        }
+    )
 
 
 # -----------------------------------------------------------------
 # AMAZON PARSER
 # -----------------------------------------------------------------
 
+@cache_df
 def parse_amazon(file) -> pd.DataFrame:
-    raw = pd.read_excel(file, sheet_name=0, header=None)
+    raw = pd.read_excel(file, sheet_name=0, header=None, engine=EXCEL_ENGINE)
     header_row = next(
         i for i, row in raw.iterrows() if any("DA Name" in str(v) for v in row)
     )
@@ -104,25 +142,13 @@ def parse_amazon(file) -> pd.DataFrame:
             col_map[col] = "amz_break_minutes"
     data = data.rename(columns=col_map)
 
-    def to_time(val):
-        if pd.isna(val):
-            return None
-        if isinstance(val, datetime):
-            return val
-        try:
-            return pd.to_datetime(str(val))
-        except Exception:
-            return None
-
     data["amz_break_minutes"] = pd.to_numeric(
         data.get("amz_break_minutes", pd.Series(dtype=float)), errors="coerce"
     )
-    data["amz_break_start"] = data.get(
-        "amz_break_start", pd.Series(dtype=object)
-    ).apply(to_time)
-    data["amz_break_end"] = data.get("amz_break_end", pd.Series(dtype=object)).apply(
-        to_time
+    data["amz_break_start"] = _to_datetime(
+        data.get("amz_break_start", pd.Series(dtype=object))
     )
+    data["amz_break_end"] = _to_datetime(data.get("amz_break_end", pd.Series(dtype=object)))
     data["amz_name"] = (
         data.get("amz_name", pd.Series(dtype=str)).astype(str).str.strip()
     )
@@ -148,99 +174,134 @@ def _split_camelcase(name: str) -> str:
     return re.sub(r"([a-z])([A-Z])", r"\1 \2", name).strip()
 
 
-def _name_tokens(name: str) -> set:
+@functools.lru_cache(maxsize=4096)
+def _name_tokens(name: str) -> frozenset:
     name = _split_camelcase(str(name))
     name = re.sub(r"[^a-zA-Z\s]", " ", name).lower()
-    return {w for w in name.split() if len(w) > 1}
-
-
-def _token_matches(ta: set, tb: set) -> int:
-    return sum(1 for a in ta if any(a in b or b in a for b in tb))
-
-
-def _overlap_score(name_a: str, name_b: str) -> float:
-    ta, tb = _name_tokens(name_a), _name_tokens(name_b)
-    if not ta or not tb:
-        return 0.0
-    return _token_matches(ta, tb) / max(len(ta), len(tb))
+    return frozenset(w for w in name.split() if len(w) > 1)
+
+
+def _substrings(tok: str) -> set:
+    """Every substring of *tok* that is at least three letters long."""
+    n = len(tok)
+    return {tok[i:j] for i in range(n) for j in range(i + 3, n + 1)}
+
+
+def _score_rows(adp_names: list, amz_names: list):
+    """Yield the overlap score of each ADP name against every Amazon name.
+
+    A token counts as matched when the other name has the same token or,
+    for tokens of 3+ letters, one that contains it or is contained by it
+    (so fragments like "al" or "jr" don't match half the roster). The score
+    is matched tokens / the larger token count, 0 when either name is empty,
+    and 1 for names that are identical ignoring case and outer spaces.
+    """
+    adp_tokens = [_name_tokens(n) for n in adp_names]
+    amz_tokens = [_name_tokens(n) for n in amz_names]
+    lb = np.array([len(t) for t in amz_tokens])
+
+    # Amazon token -> the names containing it, plus a substring index so
+    # containment is found by hash lookups rather than a pairwise scan.
+    vocab_b = {}
+    postings = defaultdict(list)
+    for j, tb in enumerate(amz_tokens):
+        for t in tb:
+            postings[vocab_b.setdefault(t, len(vocab_b))].append(j)
+    contained_in = defaultdict(list)
+    for v, k in vocab_b.items():
+        for sub in _substrings(v):
+            contained_in[sub].append(k)
+
+    # matched[u, j]: ADP token u is matched by some token of Amazon name j.
+    # Bool, and only vocab_a x names, so memory stays linear per side.
+    vocab_a = {t: k for k, t in enumerate(set().union(*adp_tokens))}
+    matched = np.zeros((len(vocab_a), len(amz_tokens)), dtype=bool)
+    for u, k in vocab_a.items():
+        hits = {vocab_b[u]} if u in vocab_b else set()
+        if len(u) >= 3:
+            hits.update(contained_in.get(u, ()))
+            hits.update(vocab_b[sub] for sub in _substrings(u) if sub in vocab_b)
+        for v in hits:
+            matched[k, postings[v]] = True
+
+    exact_b = defaultdict(list)
+    for j, n in enumerate(amz_names):
+        exact_b[str(n).strip().lower()].append(j)
+
+    for name, ta in zip(adp_names, adp_tokens):
+        scores = np.zeros(len(amz_tokens))
+        if ta:
+            hits = matched[[vocab_a[t] for t in ta]].sum(axis=0)
+            np.divide(hits, np.maximum(len(ta), lb), out=scores, where=lb > 0)
+        scores[exact_b.get(str(name).strip().lower(), [])] = 1.0
+        yield scores
 
 
 def match_employees(adp_df: pd.DataFrame, amazon_df: pd.DataFrame) -> pd.DataFrame:
     THRESHOLD = 0.33
+    ADP_COLS = ("adp_name", "adp_break_start", "adp_break_end", "adp_break_minutes")
+    AMZ_COLS = ("amz_name", "transporter_id", "amz_break_start", "amz_break_end", "amz_break_minutes")
+    COLS = ADP_COLS + AMZ_COLS + ("match_score",)
+    NO_ADP, NO_AMZ = (None,) * len(ADP_COLS), (None,) * len(AMZ_COLS)
+
+    # argmax keeps the first maximum, so ties go to the earliest Amazon row.
+    best_pos, best_scores = [], []
+    for scores in _score_rows(adp_df["adp_name"].tolist(), amazon_df["amz_name"].tolist()):
+        j = int(scores.argmax()) if len(scores) else 0
+        best_pos.append(j)
+        best_scores.append(float(scores[j]) if len(scores) else 0.0)
+
+    # Object arrays keep Timestamps as Timestamps (datetime64 .tolist() would
+    # hand back raw integers).
+    adp_vals = adp_df[list(ADP_COLS)].to_numpy(dtype=object)
+    amz_vals = amazon_df[list(AMZ_COLS)].to_numpy(dtype=object)
+
     used_amz = set()
-    matches = []
-
-    for _, adp_row in adp_df.iterrows():
-        best_score, best_amz_idx = 0, None
-        for amz_idx, amz_row in amazon_df.iterrows():
-            score = _overlap_score(adp_row["adp_name"], amz_row["amz_name"])
-            if score > best_score:
-                best_score, best_amz_idx = score, amz_idx
-
-        if best_score >= THRESHOLD and best_amz_idx is not None:
-            amz_row = amazon_df.loc[best_amz_idx]
-            matches.append(
-                {**adp_row.to_dict(), **amz_row.to_dict(), "match_score": round(best_score, 2)}
-            )
-            used_amz.add(best_amz_idx)
+    rows = []
+    for i, best_score in enumerate(best_scores):
+        if best_score >= THRESHOLD:
+            j = best_pos[i]
+            rows.append((*adp_vals[i], *amz_vals[j], round(best_score, 2)))
+            used_amz.add(j)
         else:
-            matches.append(
-                {
-                    **adp_row.to_dict(),
-                    "amz_name": None,
-                    "transporter_id": None,
-                    "amz_break_start": None,
-                    "amz_break_end": None,
-                    "amz_break_minutes": None,
-                    "match_score": 0,
-                }
-            )
+            rows.append((*adp_vals[i], *NO_AMZ, 0))
 
-    for amz_idx, amz_row in amazon_df.iterrows():
-        if amz_idx not in used_amz:
-            matches.append(
-                {
-                    "adp_name": None,
-                    "adp_break_start": None,
-                    "adp_break_end": None,
-                    "adp_break_minutes": None,
-                    **amz_row.to_dict(),
-                    "match_score": 0,
-                }
-            )
+    for j in range(len(amz_vals)):
+        if j not in used_amz:
+            rows.append((*NO_ADP, *amz_vals[j], 0))
 
-    return pd.DataFrame(matches)
+    return pd.DataFrame.from_records(rows, columns=COLS)
 
 
 # -----------------------------------------------------------------
 # DISCREPANCY CALCULATION
 # -----------------------------------------------------------------
 
+# Most to least urgent; also the sort order of the final report.
+SEVERITIES = ["Major", "Moderate", "Minor", "Missing Entry", "Match"]
+
+
 def calculate_discrepancies(df: pd.DataFrame) -> pd.DataFrame:
-    def _diff(row):
-        a, b = row.get("amz_break_minutes"), row.get("adp_break_minutes")
-        return round(a - b, 1) if pd.notna(a) and pd.notna(b) else None
-
-    def _severity(row):
-        a, b = row.get("amz_break_minutes"), row.get("adp_break_minutes")
-        if pd.isna(a) or pd.isna(b):
-            return "Missing Entry"
-        d = abs(row["diff_minutes"])
-        if d <= 1:    return "Match"
-        elif d <= 5:  return "Minor"
-        elif d <= 15: return "Moderate"
-        else:          return "Major"
-
-    def _direction(row):
-        d, sev = row.get("diff_minutes"), row.get("severity")
-        if sev == "Missing Entry": return "Warning Missing"
-        if pd.isna(d):             return "-"
-        if abs(d) <= 1:            return "Match"
-        return "Amazon > ADP" if d > 0 else "ADP > Amazon"
-
-    df["diff_minutes"] = df.apply(_diff, axis=1)
-    df["severity"]     = df.apply(_severity, axis=1)
-    df["direction"]    = df.apply(_direction, axis=1)
+    a = pd.to_numeric(df["amz_break_minutes"], errors="coerce").to_numpy(dtype=float)
+    b = pd.to_numeric(df["adp_break_minutes"], errors="coerce").to_numpy(dtype=float)
+    missing = np.isnan(a) | np.isnan(b)
+    diff = np.round(a - b, 1)
+    d = np.abs(diff)
+
+    severity = np.select(
+        [missing, d <= 1, d <= 5, d <= 15],
+        ["Missing Entry", "Match", "Minor", "Moderate"],
+        default="Major",
+    )
+    direction = np.select(
+        [missing, d <= 1, diff > 0],
+        ["Warning Missing", "Match", "Amazon > ADP"],
+        default="ADP > Amazon",
+    )
+
+    df["diff_minutes"] = np.where(missing, np.nan, diff)
+    df["severity"]     = severity.astype(object)
+    df["direction"]    = direction.astype(object)
     df["needs_action"] = df["severity"].isin(["Minor", "Moderate", "Major", "Missing Entry"])
     return df
 
@@ -249,13 +310,7 @@ def calculate_discrepancies(df: pd.DataFrame) -> pd.DataFrame:
 # CONVERSATION SCRIPTS
 # -----------------------------------------------------------------
 
-def build_script(row) -> str:
-    emp  = row.get("adp_name") or row.get("amz_name") or "Employee"
-    sev  = row.get("severity", "")
-    a_m  = row.get("amz_break_minutes")
-    b_m  = row.get("adp_break_minutes")
-    diff = row.get("diff_minutes")
-
+def build_script(emp, sev, a_m, b_m, diff) -> str:
     if sev == "Match":
         return "No action needed - break times match."
 
@@ -293,10 +348,26 @@ def run_analysis(adp_file, amazon_file) -> pd.DataFrame:
     merged    = match_employees(adp_df, amazon_df)
     result    = calculate_discrepancies(merged)
 
-    sev_order = {"Major": 0, "Moderate": 1, "Minor": 2, "Missing Entry": 3, "Match": 4}
-    result["_sort"] = result["severity"].map(sev_order).fillna(5)
-    result = result.sort_values(["_sort", "adp_name"]).reset_index(drop=True)
-    result["conversation_script"] = result.apply(build_script, axis=1)
+    result["severity"] = pd.Categorical(result["severity"], categories=SEVERITIES, ordered=True)
+    result = result.sort_values(["severity", "adp_name"]).reset_index(drop=True)
+
+    names = np.where(
+        result["adp_name"].notna(), result["adp_name"], result["amz_name"].fillna("Employee")
+    )
+    result["conversation_script"] = [
+        build_script(*args)
+        for args in zip(
+            names,
+            result["severity"].to_numpy(),
+            result["amz_break_minutes"].to_numpy(),
+            result["adp_break_minutes"].to_numpy(),
+            result["diff_minutes"].to_numpy(),
+        )
+    ]
+
+    for col in ("adp_name", "amz_name"):
+        result[col] = result[col].astype("string[pyarrow]")
+    result["display_name"] = result["adp_name"].fillna(result["amz_name"]).fillna("-")
     return result
 
 
@@ -319,158 +390,201 @@ GREEN_FONT  = "1A7A42"
 PURPLE_FILL = "EDE7F6"
 PURPLE_FONT = "6A1B9A"
 WHITE       = "FFFFFF"
+GREY_LINE   = "BDBDBD"
+
+_thin = Side(style="thin", color=GREY_LINE)
+
+# openpyxl style objects are immutable, so every cell can share these.
+_BORDER            = Border(left=_thin, right=_thin, top=_thin, bottom=_thin)
+_ALIGN_LEFT        = Alignment(horizontal="left", vertical="center")
+_ALIGN_CENTER      = Alignment(horizontal="center", vertical="center")
+_ALIGN_LEFT_WRAP   = Alignment(horizontal="left", vertical="center", wrap_text=True)
+_ALIGN_CENTER_WRAP = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+
+def _fmt_times(col: pd.Series) -> list:
+    """Format a column of timestamps as "1:05 PM", with "-" where missing."""
+    return pd.to_datetime(col, errors="coerce").dt.strftime("%-I:%M %p").fillna("-").tolist()
 
-_thin = Side(style="thin", color="BDBDBD")
 
+def _fmt_nums(col: pd.Series, fmt: str) -> list:
+    """Format a numeric column with *fmt*, with "-" where missing."""
+    col = pd.to_numeric(col, errors="coerce")
+    return col.map(fmt.format, na_action="ignore").fillna("-").tolist()
 
-def _bdr():
-    return Border(left=_thin, right=_thin, top=_thin, bottom=_thin)
 
+_SEV_COLORS = {
+    "Major":         (RED_FILL,    RED_FONT),
+    "Moderate":      (AMBER_FILL,  AMBER_FONT),
+    "Minor":         (YELLOW_FILL, YELLOW_FONT),
+    "Missing Entry": (PURPLE_FILL, PURPLE_FONT),
+}
 
-def _fmt_time(val):
-    if val is None or (isinstance(val, float) and np.isnan(val)):
-        return "-"
-    try:
-        return val.strftime("%-I:%M %p") if hasattr(val, "strftime") else str(val)
-    except Exception:
-        return str(val)
+
+_SEV_STYLE = {
+    sev: (PatternFill("solid", fgColor=fill), fcolor)
+    for sev, (fill, fcolor) in _SEV_COLORS.items()
+}
+_DEFAULT_STYLE = (PatternFill("solid", fgColor=GREEN_FILL), GREEN_FONT)
 
 
 def _sev_style(sev):
-    return {
-        "Major":         (PatternFill("solid", fgColor=RED_FILL),    RED_FONT),
-        "Moderate":      (PatternFill("solid", fgColor=AMBER_FILL),  AMBER_FONT),
-        "Minor":         (PatternFill("solid", fgColor=YELLOW_FILL), YELLOW_FONT),
-        "Missing Entry": (PatternFill("solid", fgColor=PURPLE_FILL), PURPLE_FONT),
-    }.get(sev, (PatternFill("solid", fgColor=GREEN_FILL), GREEN_FONT))
+    return _SEV_STYLE.get(sev, _DEFAULT_STYLE)
+
+
+@functools.lru_cache(maxsize=None)
+def _body_font(color, bold):
+    return Font(name="Arial", size=10, color=color, bold=bold)
+
+
+REPORT_HEADERS = [
+    "Employee (ADP)", "Amazon DA Name", "Amazon Break Start", "Amazon Break End",
+    "Amazon Break (min)", "ADP Break Start", "ADP Break End", "ADP Break (min)",
+    "Difference (min)", "Severity", "Action Required",
+]
+REPORT_WIDTHS  = [28, 26, 14, 14, 14, 14, 14, 14, 14, 16, 18]
+SCRIPT_HEADERS = ["#", "Employee", "Severity", "Amazon (min)", "ADP (min)", "Difference", "Script"]
+SCRIPT_WIDTHS  = [5, 28, 16, 14, 14, 12, 75]
+LEGEND = "  Major (>15 min)  Moderate (6-15 min)  Minor (2-5 min)  Missing Entry  Match (<=1 min)"
+
+# Above this many rows export_excel streams the workbook with xlsxwriter.
+_STREAMING_ROWS = 2000
+
+
+def _report_title(report_date: str, station: str) -> str:
+    return f"  Break Time Discrepancy Report  |  Station {station}  |  {report_date}  |  Review by 5:00 PM EST"
+
+
+def _script_title(report_date: str, station: str) -> str:
+    return f"  5 PM Correction Conversations  |  Station {station}  |  {report_date}"
+
+
+def _summary(df: pd.DataFrame) -> str:
+    return (
+        f"  SUMMARY: {int(df['needs_action'].sum())} employees need correction out of {len(df)} reviewed  "
+        "|  All corrections due by 5:00 PM EST"
+    )
+
+
+def _report_rows(df: pd.DataFrame):
+    """Yield (cell values, severity) for each row of the discrepancy sheet."""
+    sev = df["severity"].to_numpy()
+    columns = [
+        df["adp_name"].fillna("-").astype(str).tolist(),
+        df["amz_name"].fillna("-").astype(str).tolist(),
+        _fmt_times(df["amz_break_start"]),
+        _fmt_times(df["amz_break_end"]),
+        _fmt_nums(df["amz_break_minutes"], "{:.0f}"),
+        _fmt_times(df["adp_break_start"]),
+        _fmt_times(df["adp_break_end"]),
+        _fmt_nums(df["adp_break_minutes"], "{:.0f}"),
+        _fmt_nums(df["diff_minutes"], "{:+.1f}"),
+        sev.tolist(),
+        np.where(sev == "Match", "No action", "Correct by 5 PM").tolist(),
+    ]
+    for vals in zip(*columns):
+        yield list(vals), vals[9]
+
+
+def _script_rows(df: pd.DataFrame):
+    """Yield (cell values, severity) for each row of the 5 PM scripts sheet."""
+    issues = df[df["needs_action"]]
+    names = issues["display_name"].astype(str)
+    columns = [
+        range(1, len(issues) + 1),
+        names.tolist(),
+        issues["severity"].tolist(),
+        _fmt_nums(issues["amz_break_minutes"], "{:.0f} min"),
+        _fmt_nums(issues["adp_break_minutes"], "{:.0f} min"),
+        _fmt_nums(issues["diff_minutes"], "{:+.1f} min"),
+        issues["conversation_script"].tolist(),
+    ]
+    for vals in zip(*columns):
+        yield list(vals), vals[2]
+
 
+def export_excel(
+    df: pd.DataFrame, report_date: str = "", station: str = "DFH1", streaming: bool = False
+) -> bytes:
+    if streaming or len(df) > _STREAMING_ROWS:
+        return _export_excel_streaming(df, report_date, station)
 
-def export_excel(df: pd.DataFrame, report_date: str = "", station: str = "DFH1") -> bytes:
     wb = Workbook()
 
     ws = wb.active
     ws.title = "Discrepancy Report"
 
     ws.merge_cells("A1:K1")
-    ws["A1"] = f"  Break Time Discrepancy Report  |  Station {station}  |  {report_date}  |  Review by 5:00 PM EST"
+    ws["A1"] = _report_title(report_date, station)
     ws["A1"].font = Font(name="Arial", bold=True, size=13, color=WHITE)
     ws["A1"].fill = PatternFill("solid", fgColor=DARK_NAVY)
-    ws["A1"].alignment = Alignment(horizontal="left", vertical="center")
+    ws["A1"].alignment = _ALIGN_LEFT
     ws.row_dimensions[1].height = 32
 
     ws.merge_cells("A2:K2")
-    ws["A2"] = "  Major (>15 min)  Moderate (6-15 min)  Minor (2-5 min)  Missing Entry  Match (<=1 min)"
+    ws["A2"] = LEGEND
     ws["A2"].font = Font(name="Arial", size=9, italic=True, color="444444")
     ws["A2"].fill = PatternFill("solid", fgColor=LIGHT_BLUE)
-    ws["A2"].alignment = Alignment(horizontal="left", vertical="center")
+    ws["A2"].alignment = _ALIGN_LEFT
     ws.row_dimensions[2].height = 18
 
-    col_headers = [
-        "Employee (ADP)", "Amazon DA Name", "Amazon Break Start", "Amazon Break End",
-        "Amazon Break (min)", "ADP Break Start", "ADP Break End", "ADP Break (min)",
-        "Difference (min)", "Severity", "Action Required",
-    ]
-    for c, h in enumerate(col_headers, 1):
+    for c, h in enumerate(REPORT_HEADERS, 1):
         cell = ws.cell(row=3, column=c, value=h)
         cell.font = Font(name="Arial", bold=True, size=10, color=WHITE)
         cell.fill = PatternFill("solid", fgColor=MID_BLUE)
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-        cell.border = _bdr()
+        cell.alignment = _ALIGN_CENTER_WRAP
+        cell.border = _BORDER
     ws.row_dimensions[3].height = 36
 
-    disc_count = 0
-    for r_idx, row in df.iterrows():
-        er = r_idx + 4
-        sev = row.get("severity", "-")
+    for er, (vals, sev) in enumerate(_report_rows(df), 4):
         fill, fcolor = _sev_style(sev)
-        a_m  = row.get("amz_break_minutes")
-        b_m  = row.get("adp_break_minutes")
-        diff = row.get("diff_minutes")
-
-        vals = [
-            str(row.get("adp_name") or "-"),
-            str(row.get("amz_name") or "-"),
-            _fmt_time(row.get("amz_break_start")),
-            _fmt_time(row.get("amz_break_end")),
-            f"{a_m:.0f}" if pd.notna(a_m) else "-",
-            _fmt_time(row.get("adp_break_start")),
-            _fmt_time(row.get("adp_break_end")),
-            f"{b_m:.0f}" if pd.notna(b_m) else "-",
-            f"{diff:+.1f}" if pd.notna(diff) else "-",
-            sev,
-            "No action" if sev == "Match" else "Correct by 5 PM",
-        ]
-        if row.get("needs_action"):
-            disc_count += 1
-        for c, v in enumerate(vals, 1):
-            cell = ws.cell(row=er, column=c, value=v)
+        ws.append(vals)
+        for c, cell in enumerate(ws[er], 1):
             cell.fill = fill
-            cell.border = _bdr()
-            cell.alignment = Alignment(horizontal="left" if c == 1 else "center", vertical="center")
-            cell.font = Font(name="Arial", size=10, color=fcolor, bold=(c in [9, 10] and sev != "Match"))
+            cell.border = _BORDER
+            cell.alignment = _ALIGN_LEFT if c == 1 else _ALIGN_CENTER
+            cell.font = _body_font(fcolor, c in (9, 10) and sev != "Match")
         ws.row_dimensions[er].height = 20
 
     footer_r = len(df) + 4
     ws.merge_cells(f"A{footer_r}:K{footer_r}")
-    ws[f"A{footer_r}"] = (
-        f"  SUMMARY: {disc_count} employees need correction out of {len(df)} reviewed  "
-        "|  All corrections due by 5:00 PM EST"
-    )
+    ws[f"A{footer_r}"] = _summary(df)
     ws[f"A{footer_r}"].font = Font(name="Arial", bold=True, size=11, color=WHITE)
     ws[f"A{footer_r}"].fill = PatternFill("solid", fgColor=ORANGE)
-    ws[f"A{footer_r}"].alignment = Alignment(horizontal="left", vertical="center")
+    ws[f"A{footer_r}"].alignment = _ALIGN_LEFT
     ws.row_dimensions[footer_r].height = 24
 
-    for i, w in enumerate([28, 26, 14, 14, 14, 14, 14, 14, 14, 16, 18], 1):
+    for i, w in enumerate(REPORT_WIDTHS, 1):
         ws.column_dimensions[get_column_letter(i)].width = w
     ws.freeze_panes = "A4"
 
     ws2 = wb.create_sheet("5PM Scripts")
     ws2.merge_cells("A1:G1")
-    ws2["A1"] = f"  5 PM Correction Conversations  |  Station {station}  |  {report_date}"
+    ws2["A1"] = _script_title(report_date, station)
     ws2["A1"].font = Font(name="Arial", bold=True, size=13, color=WHITE)
     ws2["A1"].fill = PatternFill("solid", fgColor=DARK_NAVY)
-    ws2["A1"].alignment = Alignment(horizontal="left", vertical="center")
+    ws2["A1"].alignment = _ALIGN_LEFT
     ws2.row_dimensions[1].height = 30
 
-    for c, h in enumerate(["#", "Employee", "Severity", "Amazon (min)", "ADP (min)", "Difference", "Script"], 1):
+    for c, h in enumerate(SCRIPT_HEADERS, 1):
         cell = ws2.cell(row=2, column=c, value=h)
         cell.font = Font(name="Arial", bold=True, size=10, color=WHITE)
         cell.fill = PatternFill("solid", fgColor=MID_BLUE)
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-        cell.border = _bdr()
+        cell.alignment = _ALIGN_CENTER
+        cell.border = _BORDER
     ws2.row_dimensions[2].height = 28
 
-    issues = df[df["needs_action"]].reset_index(drop=True)
-    for r_idx, row in issues.iterrows():
-        er = r_idx + 3
-        sev = row.get("severity", "-")
+    for er, (vals, sev) in enumerate(_script_rows(df), 3):
         fill, fcolor = _sev_style(sev)
-        a_m  = row.get("amz_break_minutes")
-        b_m  = row.get("adp_break_minutes")
-        diff = row.get("diff_minutes")
-        vals = [
-            r_idx + 1,
-            str(row.get("adp_name") or row.get("amz_name") or "-"),
-            sev,
-            f"{a_m:.0f} min" if pd.notna(a_m) else "-",
-            f"{b_m:.0f} min" if pd.notna(b_m) else "-",
-            f"{diff:+.1f} min" if pd.notna(diff) else "-",
-            row.get("conversation_script", ""),
-        ]
-        for c, v in enumerate(vals, 1):
-            cell = ws2.cell(row=er, column=c, value=v)
+        ws2.append(vals)
+        for c, cell in enumerate(ws2[er], 1):
             cell.fill = fill
-            cell.border = _bdr()
-            cell.font = Font(name="Arial", size=10, color=fcolor, bold=(c in [3, 6]))
-            cell.alignment = Alignment(
-                horizontal="left" if c in [2, 7] else "center",
-                vertical="center",
-                wrap_text=True,
-            )
+            cell.border = _BORDER
+            cell.font = _body_font(fcolor, c in (3, 6))
+            cell.alignment = _ALIGN_LEFT_WRAP if c in [2, 7] else _ALIGN_CENTER_WRAP
         ws2.row_dimensions[er].height = 90
 
-    for i, w in enumerate([5, 28, 16, 14, 14, 12, 75], 1):
+    for i, w in enumerate(SCRIPT_WIDTHS, 1):
         ws2.column_dimensions[get_column_letter(i)].width = w
     ws2.freeze_panes = "A3"
 
@@ -478,3 +592,82 @@ def export_excel(df: pd.DataFrame, report_date: str = "", station: str = "DFH1")
     wb.save(buf)
     buf.seek(0)
     return buf.read()
+
+
+def _export_excel_streaming(df: pd.DataFrame, report_date: str, station: str) -> bytes:
+    """Same workbook as export_excel, streamed row by row with xlsxwriter.
+
+    constant_memory flushes each row to a temp file as soon as the next one
+    starts, so memory stays flat however long the roster is. (xlsxwriter
+    ignores constant_memory when in_memory is set, so that is left off.)
+    """
+    import xlsxwriter
+
+    buf = BytesIO()
+    wb = xlsxwriter.Workbook(
+        buf, {"constant_memory": True, "strings_to_urls": False}
+    )
+    formats = {}
+
+    def fmt(**props):
+        key = tuple(sorted(props.items()))
+        if key not in formats:
+            formats[key] = wb.add_format({"font_name": "Arial", "valign": "vcenter", **props})
+        return formats[key]
+
+    def body_fmt(sev, left, bold, wrap):
+        fill, fcolor = _SEV_COLORS.get(sev, (GREEN_FILL, GREEN_FONT))
+        return fmt(
+            font_size=10, font_color=f"#{fcolor}", bold=bold, bg_color=f"#{fill}",
+            align="left" if left else "center", text_wrap=wrap,
+            border=1, border_color=f"#{GREY_LINE}",
+        )
+
+    title_fmt  = fmt(font_size=13, bold=True, font_color=f"#{WHITE}", bg_color=f"#{DARK_NAVY}", align="left")
+    legend_fmt = fmt(font_size=9, italic=True, font_color="#444444", bg_color=f"#{LIGHT_BLUE}", align="left")
+    footer_fmt = fmt(font_size=11, bold=True, font_color=f"#{WHITE}", bg_color=f"#{ORANGE}", align="left")
+
+    def header_fmt(wrap):
+        return fmt(
+            font_size=10, bold=True, font_color=f"#{WHITE}", bg_color=f"#{MID_BLUE}",
+            align="center", text_wrap=wrap, border=1, border_color=f"#{GREY_LINE}",
+        )
+
+    ws = wb.add_worksheet("Discrepancy Report")
+    for i, w in enumerate(REPORT_WIDTHS):
+        ws.set_column(i, i, w)
+    ws.freeze_panes(3, 0)
+    last_col = len(REPORT_HEADERS) - 1
+
+    ws.set_row(0, 32)
+    ws.merge_range(0, 0, 0, last_col, _report_title(report_date, station), title_fmt)
+    ws.set_row(1, 18)
+    ws.merge_range(1, 0, 1, last_col, LEGEND, legend_fmt)
+    ws.set_row(2, 36)
+    ws.write_row(2, 0, REPORT_HEADERS, header_fmt(True))
+
+    for er, (vals, sev) in enumerate(_report_rows(df), 3):
+        ws.set_row(er, 20)
+        for c, v in enumerate(vals, 1):
+            ws.write(er, c - 1, v, body_fmt(sev, c == 1, c in [9, 10] and sev != "Match", False))
+    footer_r = len(df) + 3
+    ws.set_row(footer_r, 24)
+    ws.merge_range(footer_r, 0, footer_r, last_col, _summary(df), footer_fmt)
+
+    ws2 = wb.add_worksheet("5PM Scripts")
+    for i, w in enumerate(SCRIPT_WIDTHS):
+        ws2.set_column(i, i, w)
+    ws2.freeze_panes(2, 0)
+
+    ws2.set_row(0, 30)
+    ws2.merge_range(0, 0, 0, len(SCRIPT_HEADERS) - 1, _script_title(report_date, station), title_fmt)
+    ws2.set_row(1, 28)
+    ws2.write_row(1, 0, SCRIPT_HEADERS, header_fmt(False))
+
+    for er, (vals, sev) in enumerate(_script_rows(df), 2):
+        ws2.set_row(er, 90)
+        for c, v in enumerate(vals, 1):
+            ws2.write(er, c - 1, v, body_fmt(sev, c in [2, 7], c in [3, 6], True))
+
+    wb.close()
+    return buf.getvalue()
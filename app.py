@@ -4,12 +4,15 @@ Supports multiple stations (DFH1, DVB8). Station is auto-detected from
 uploaded filenames and can be overridden via the sidebar selector.
 """
 
+import io
+import functools
+import hashlib
 import streamlit as st
 import pandas as pd
 import numpy as np
 import re
 from datetime import date, datetime
-from analysis import run_analysis, export_excel
+from analysis import run_analysis, export_excel, SEVERITIES
 
 # -----------------------------------------------------------------
 # PAGE CONFIG
@@ -22,11 +25,15 @@ st.set_page_config(
 )
 
 KNOWN_STATIONS = ["DFH1", "DVB8"]
+# No \b anchors: filenames like ADP_DFH1_2-18.xlsx put the code between
+# underscores, which are word characters.
+_STATION_RE = re.compile("|".join(map(re.escape, KNOWN_STATIONS)), re.IGNORECASE)
+_DATE_RE = re.compile(r"(\d{1,2})[._-](\d{1,2})[._-]?(\d{2,4})?")
 
 # -----------------------------------------------------------------
 # CUSTOM CSS
 # -----------------------------------------------------------------
-st.markdown("""
+_CSS = """
 <style>
 [data-testid="stAppViewContainer"] { background: #F7F9FC; }
 [data-testid="stSidebar"]          { background: #FFFFFF; border-right: 2px solid #1B2A4A; }
@@ -81,7 +88,48 @@ st.markdown("""
     border-radius:6px; padding:10px 14px; font-size:0.85rem; color:#1B2A4A;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Static HTML blocks and templates, built once at import rather than per rerun.
+_LOGIN_HTML = """
+    <div style="max-width:380px;margin:80px auto 0;text-align:center;">
+      <div style="font-size:2.8rem;margin-bottom:8px;">T</div>
+      <h2 style="color:#1B2A4A;margin-bottom:4px;">MLM Break Time Tracker</h2>
+      <p style="color:#6B7280;font-size:0.9rem;">Enter your access password to continue</p>
+    </div>
+    """
+
+_WELCOME_HEADER_HTML = """
+        <div class="page-header">
+          <h1>MLM Break Time Tracker</h1>
+          <p>Upload the ADP and Amazon files in the sidebar, confirm the station, then click <strong>Run Analysis</strong>.</p>
+        </div>
+        """
+
+_FOLDER_STRUCTURE_HTML = """
+        <div class="folder-tip">
+        Save your daily downloaded reports to the matching station folder on your computer:<br><br>
+        <code>MLM / DFH1 / Reports / Break_Discrepancy_Report_DFH1_February-18-2026.xlsx</code><br>
+        <code>MLM / DVB8 / Reports / Break_Discrepancy_Report_DVB8_February-18-2026.xlsx</code>
+        </div>
+        """
+
+_REPORT_HEADER_TMPL = """
+    <div class="page-header">
+      <h1>Break Time Discrepancy Report
+        <span class="station-badge">{station}</span>
+      </h1>
+      <p>{report_date}  -
+         <strong style="color:#E87722;">{disc_count} employee{plural}
+         need{verb_s} correction before 5 PM</strong>
+      </p>
+    </div>
+    """
+
+_SAVE_TIP_TMPL = (
+    '<div class="folder-tip">Save this report to: '
+    "<code>MLM / {station} / Reports / {filename}</code></div>"
+)
 
 
 # -----------------------------------------------------------------
@@ -91,13 +139,7 @@ def check_password() -> bool:
     if st.session_state.get("authenticated"):
         return True
 
-    st.markdown("""
-    <div style="max-width:380px;margin:80px auto 0;text-align:center;">
-      <div style="font-size:2.8rem;margin-bottom:8px;">T</div>
-      <h2 style="color:#1B2A4A;margin-bottom:4px;">MLM Break Time Tracker</h2>
-      <p style="color:#6B7280;font-size:0.9rem;">Enter your access password to continue</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_LOGIN_HTML, unsafe_allow_html=True)
 
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
@@ -124,31 +166,77 @@ SEV_CLASS = {
     "Match":         ("",          "CHECK"),
 }
 
-def fmt_time(val):
-    if val is None or (isinstance(val, float) and np.isnan(val)): return "-"
-    try:
-        return val.strftime("%-I:%M %p") if hasattr(val, "strftime") else str(val)
-    except Exception: return str(val)
-
+# Table row styles, indexed by severity category code (same order as SEVERITIES).
+_CSS_BY_SEV = np.array([
+    "background-color:#FDDCDC;color:#C0392B",
+    "background-color:#FFF3CD;color:#856404",
+    "background-color:#FFF8DC;color:#8B6914",
+    "background-color:#EDE7F6;color:#6A1B9A",
+    "background-color:#D5F5E3;color:#1A7A42",
+])
+
+def _severity_styles(df: pd.DataFrame, columns) -> pd.DataFrame:
+    row_css = _CSS_BY_SEV[df["severity"].cat.codes.to_numpy()]
+    return pd.DataFrame(np.broadcast_to(row_css[:, None], (len(df), len(columns))),
+                        index=df.index, columns=columns)
+
+# Past this many rows a table goes out as plain Arrow; the per-cell Styler CSS
+# would dominate the payload, and the icon prefix still marks the severity.
+STYLED_ROWS_MAX = 500
+_SEV_HELP = ", ".join(f"{icon} {sev}" for sev, (_, icon) in SEV_CLASS.items())
+
+def _table_data(display_df: pd.DataFrame, df: pd.DataFrame):
+    if len(display_df) > STYLED_ROWS_MAX:
+        return display_df
+    return display_df.style.apply(lambda _: _severity_styles(df, display_df.columns), axis=None)
+
+def fmt_time(col: pd.Series) -> pd.Series:
+    return pd.to_datetime(col, errors="coerce").dt.strftime("%-I:%M %p").fillna("-")
+
+def _fmt_col(col: pd.Series, fmt: str) -> pd.Series:
+    return col.map(fmt.format, na_action="ignore").fillna("-")
+
+def _status_labels(df: pd.DataFrame) -> pd.Series:
+    sev = df["severity"].astype(str)
+    return sev.map({k: icon for k, (_, icon) in SEV_CLASS.items()}).fillna("") + " " + sev
+
+@functools.lru_cache(maxsize=32)
 def detect_station(adp_name: str, amz_name: str) -> str:
-    combined = f"{adp_name} {amz_name}".upper()
-    for s in KNOWN_STATIONS:
-        if s in combined:
-            return s
-    return ""
+    # When both names carry a code, KNOWN_STATIONS order wins, not position.
+    found = {m.upper() for m in _STATION_RE.findall(f"{adp_name} {amz_name}")}
+    return min(found, key=KNOWN_STATIONS.index) if found else ""
 
 def infer_date(adp_name: str, amz_name: str) -> str:
+    # today is part of the key so a long-running server doesn't serve
+    # yesterday's fallback date from the cache.
+    return _infer_date(adp_name, amz_name, date.today())
+
+@functools.lru_cache(maxsize=32)
+def _infer_date(adp_name: str, amz_name: str, today: date) -> str:
     for fname in [adp_name, amz_name]:
-        m = re.search(r"(\d{1,2})[._-](\d{1,2})[._-]?(\d{2,4})?", fname)
+        m = _DATE_RE.search(fname)
         if m:
             mo, dy = m.group(1), m.group(2)
-            yr = m.group(3) or str(date.today().year)
+            yr = m.group(3) or str(today.year)
             yr = f"20{yr}" if len(yr) == 2 else yr
             try:
                 return datetime(int(yr), int(mo), int(dy)).strftime("%B %d, %Y")
             except Exception:
                 pass
-    return date.today().strftime("%B %d, %Y")
+    return today.strftime("%B %d, %Y")
+
+
+# Keyed on the uploaded bytes, so re-running on the same files skips parsing.
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_run_analysis(adp_bytes: bytes, amz_bytes: bytes, adp_name: str, amz_name: str) -> pd.DataFrame:
+    return run_analysis(io.BytesIO(adp_bytes), io.BytesIO(amz_bytes))
+
+
+# The leading underscore keeps Streamlit from hashing the frame on every rerun;
+# results_key (a digest of the uploaded files) identifies it instead.
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_export_excel(_df: pd.DataFrame, results_key: str, report_date: str, station: str) -> bytes:
+    return export_excel(_df, report_date, station)
 
 
 # -----------------------------------------------------------------
@@ -165,12 +253,18 @@ def render_sidebar():
 
         st.markdown("### Station")
 
-        auto_station = ""
-        if adp_file and amazon_file:
-            auto_station = detect_station(adp_file.name, amazon_file.name)
+        # Only redo detection when a different pair of files is uploaded.
+        station_key = (getattr(adp_file, "file_id", None), getattr(amazon_file, "file_id", None))
+        if st.session_state.get("_station_key") != station_key:
+            auto_station = ""
+            if adp_file and amazon_file:
+                auto_station = detect_station(adp_file.name, amazon_file.name)
 
-        station_options = KNOWN_STATIONS + ([] if auto_station in KNOWN_STATIONS else [auto_station])
-        default_idx     = station_options.index(auto_station) if auto_station in station_options else 0
+            station_options = KNOWN_STATIONS + ([] if auto_station in KNOWN_STATIONS else [auto_station])
+            default_idx     = station_options.index(auto_station) if auto_station in station_options else 0
+            st.session_state["_station_key"]    = station_key
+            st.session_state["_station_detect"] = (auto_station, station_options, default_idx)
+        auto_station, station_options, default_idx = st.session_state["_station_detect"]
 
         station = st.selectbox(
             "Select station",
@@ -211,6 +305,8 @@ def render_sidebar():
         if st.button("Sign Out", use_container_width=True):
             st.session_state["authenticated"] = False
             st.session_state.pop("results", None)
+            st.session_state.pop("results_key", None)
+            st.session_state.pop("issues", None)
             st.rerun()
 
         st.markdown(
@@ -225,69 +321,56 @@ def render_sidebar():
 # -----------------------------------------------------------------
 # METRIC CARDS
 # -----------------------------------------------------------------
+_CARD_TMPL = ('<div class="metric-card c-{key}">'
+              '<div class="val">{val}</div><div class="lbl">{lbl}</div></div>')
+
 def render_metrics(df: pd.DataFrame):
-    counts = df["severity"].value_counts()
+    # severity is a Categorical over SEVERITIES, so its codes count directly.
+    major, moderate, minor, missing, match = np.bincount(
+        df["severity"].cat.codes.to_numpy(), minlength=len(SEVERITIES)
+    )
     needs  = int(df["needs_action"].sum())
     cards  = [
-        ("total",   len(df),                        "Total Employees"),
-        ("action",  needs,                          "Need Action"),
-        ("major",   counts.get("Major", 0),         "Major"),
-        ("mod",     counts.get("Moderate", 0),      "Moderate"),
-        ("minor",   counts.get("Minor", 0),         "Minor"),
-        ("missing", counts.get("Missing Entry", 0), "Missing Entry"),
-        ("match",   counts.get("Match", 0),         "Match"),
+        ("total",   len(df),  "Total Employees"),
+        ("action",  needs,    "Need Action"),
+        ("major",   major,    "Major"),
+        ("mod",     moderate, "Moderate"),
+        ("minor",   minor,    "Minor"),
+        ("missing", missing,  "Missing Entry"),
+        ("match",   match,    "Match"),
     ]
-    html = '<div class="metric-row">'
-    for key, val, lbl in cards:
-        html += (f'<div class="metric-card c-{key}">'
-                 f'<div class="val">{val}</div><div class="lbl">{lbl}</div></div>')
-    html += "</div>"
+    html = ('<div class="metric-row">'
+            + "".join(_CARD_TMPL.format(key=key, val=val, lbl=lbl) for key, val, lbl in cards)
+            + "</div>")
     st.markdown(html, unsafe_allow_html=True)
 
 
 # -----------------------------------------------------------------
 # TAB 1 - DISCREPANCY TABLE
 # -----------------------------------------------------------------
-def render_table(df: pd.DataFrame):
-    issues = df[df["needs_action"]].copy()
+def render_table(issues: pd.DataFrame):
     if issues.empty:
         st.success("No discrepancies today - all break times match!")
         return
 
-    rows = []
-    for _, row in issues.iterrows():
-        sev  = row.get("severity", "-")
-        a_m  = row.get("amz_break_minutes")
-        b_m  = row.get("adp_break_minutes")
-        diff = row.get("diff_minutes")
-        _, icon = SEV_CLASS.get(sev, ("", ""))
-        rows.append({
-            "Employee":      str(row.get("adp_name") or row.get("amz_name") or "-"),
-            "Severity":      f"{icon} {sev}",
-            "Amazon Break":  f"{a_m:.0f} min" if pd.notna(a_m) else "-",
-            "ADP Break":     f"{b_m:.0f} min" if pd.notna(b_m) else "-",
-            "Difference":    f"{diff:+.1f} min" if pd.notna(diff) else "-",
-            "Direction":     str(row.get("direction", "-")),
-            "Amz Start":     fmt_time(row.get("amz_break_start")),
-            "Amz End":       fmt_time(row.get("amz_break_end")),
-            "ADP Start":     fmt_time(row.get("adp_break_start")),
-            "ADP End":       fmt_time(row.get("adp_break_end")),
-        })
-
-    display_df = pd.DataFrame(rows)
-
-    def color_row(row):
-        s = row["Severity"]
-        if "Major"    in s: return ["background-color:#FDDCDC;color:#C0392B"] * len(row)
-        if "Moderate" in s: return ["background-color:#FFF3CD;color:#856404"] * len(row)
-        if "Minor"    in s: return ["background-color:#FFF8DC;color:#8B6914"] * len(row)
-        if "Missing"  in s: return ["background-color:#EDE7F6;color:#6A1B9A"] * len(row)
-        return [""] * len(row)
+    display_df = pd.DataFrame({
+        "Employee":     issues["display_name"].astype(str),
+        "Severity":     _status_labels(issues),
+        "Amazon Break": _fmt_col(issues["amz_break_minutes"], "{:.0f} min"),
+        "ADP Break":    _fmt_col(issues["adp_break_minutes"], "{:.0f} min"),
+        "Difference":   _fmt_col(issues["diff_minutes"], "{:+.1f} min"),
+        "Direction":    issues["direction"].astype(str),
+        "Amz Start":    fmt_time(issues["amz_break_start"]),
+        "Amz End":      fmt_time(issues["amz_break_end"]),
+        "ADP Start":    fmt_time(issues["adp_break_start"]),
+        "ADP End":      fmt_time(issues["adp_break_end"]),
+    })
 
     st.markdown(f"**{len(issues)} employees need action before 5 PM today:**")
     st.dataframe(
-        display_df.style.apply(color_row, axis=1),
+        _table_data(display_df, issues),
         use_container_width=True,
+        column_config={"Severity": st.column_config.TextColumn(help=_SEV_HELP)},
         height=min(420, 60 + len(issues) * 38),
         hide_index=True,
     )
@@ -296,8 +379,11 @@ def render_table(df: pd.DataFrame):
 # -----------------------------------------------------------------
 # TAB 2 - CONVERSATION SCRIPTS
 # -----------------------------------------------------------------
-def render_scripts(df: pd.DataFrame):
-    issues = df[df["needs_action"]].reset_index(drop=True)
+SCRIPTS_PER_PAGE = 25
+
+# A fragment, so flipping pages reruns just this tab instead of the whole app.
+@st.fragment
+def render_scripts(issues: pd.DataFrame):
     if issues.empty:
         st.success("No conversations needed today - all break times match!")
         return
@@ -305,19 +391,23 @@ def render_scripts(df: pd.DataFrame):
     st.markdown(f"**{len(issues)} employees to speak with at 5 PM.** Expand any card to copy the script.")
     st.markdown("")
 
-    for _, row in issues.iterrows():
-        sev    = row.get("severity", "-")
-        emp    = str(row.get("adp_name") or row.get("amz_name") or "-")
-        script = row.get("conversation_script", "")
-        a_m    = row.get("amz_break_minutes")
-        b_m    = row.get("adp_break_minutes")
-        diff   = row.get("diff_minutes")
+    # Each card is an expander, markdown and code block, so long days are paged.
+    if len(issues) > SCRIPTS_PER_PAGE:
+        pages = -(-len(issues) // SCRIPTS_PER_PAGE)
+        page  = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1, key="scripts_page")
+        start = (page - 1) * SCRIPTS_PER_PAGE
+        st.caption(f"Showing {start + 1}-{min(start + SCRIPTS_PER_PAGE, len(issues))} of {len(issues)}")
+        issues = issues.iloc[start:start + SCRIPTS_PER_PAGE]
+
+    sevs    = issues["severity"].astype(str)
+    emps    = issues["display_name"].astype(str)
+    scripts = issues["conversation_script"].fillna("")
+    a_strs  = _fmt_col(issues["amz_break_minutes"], "{:.0f} min")
+    b_strs  = _fmt_col(issues["adp_break_minutes"], "{:.0f} min")
+    d_strs  = _fmt_col(issues["diff_minutes"], "{:+.1f} min")
+
+    for sev, emp, script, a_str, b_str, d_str in zip(sevs, emps, scripts, a_strs, b_strs, d_strs):
         sc, icon = SEV_CLASS.get(sev, ("", ""))
-
-        a_str = f"{a_m:.0f} min" if pd.notna(a_m) else "-"
-        b_str = f"{b_m:.0f} min" if pd.notna(b_m) else "-"
-        d_str = f"{diff:+.1f} min" if pd.notna(diff) else "-"
-
         with st.expander(
             f"{icon}  **{emp}** - {sev}  |  Amazon: {a_str}  ADP: {b_str}  Diff: {d_str}"
         ):
@@ -334,36 +424,20 @@ def render_scripts(df: pd.DataFrame):
 # TAB 3 - ALL EMPLOYEES
 # -----------------------------------------------------------------
 def render_all(df: pd.DataFrame):
-    rows = []
-    for _, row in df.iterrows():
-        sev  = row.get("severity", "-")
-        a_m  = row.get("amz_break_minutes")
-        b_m  = row.get("adp_break_minutes")
-        diff = row.get("diff_minutes")
-        _, icon = SEV_CLASS.get(sev, ("", ""))
-        rows.append({
-            "Employee (ADP)": str(row.get("adp_name") or "-"),
-            "Amazon DA Name": str(row.get("amz_name") or "-"),
-            "Amazon (min)":   f"{a_m:.0f}" if pd.notna(a_m) else "-",
-            "ADP (min)":      f"{b_m:.0f}" if pd.notna(b_m) else "-",
-            "Difference":     f"{diff:+.1f}" if pd.notna(diff) else "-",
-            "Status":         f"{icon} {sev}",
-        })
-
-    full_df = pd.DataFrame(rows)
-
-    def color_row(row):
-        s = row["Status"]
-        if "Major"    in s: return ["background-color:#FDDCDC;color:#C0392B"] * len(row)
-        if "Moderate" in s: return ["background-color:#FFF3CD;color:#856404"] * len(row)
-        if "Minor"    in s: return ["background-color:#FFF8DC;color:#8B6914"] * len(row)
-        if "Missing"  in s: return ["background-color:#EDE7F6;color:#6A1B9A"] * len(row)
-        return ["background-color:#D5F5E3;color:#1A7A42"] * len(row)
+    full_df = pd.DataFrame({
+        "Employee (ADP)": df["adp_name"].fillna("-").astype(str),
+        "Amazon DA Name": df["amz_name"].fillna("-").astype(str),
+        "Amazon (min)":   _fmt_col(df["amz_break_minutes"], "{:.0f}"),
+        "ADP (min)":      _fmt_col(df["adp_break_minutes"], "{:.0f}"),
+        "Difference":     _fmt_col(df["diff_minutes"], "{:+.1f}"),
+        "Status":         _status_labels(df),
+    })
 
     st.markdown(f"**All {len(df)} employees reviewed:**")
     st.dataframe(
-        full_df.style.apply(color_row, axis=1),
+        _table_data(full_df, df),
         use_container_width=True,
+        column_config={"Status": st.column_config.TextColumn(help=_SEV_HELP)},
         height=min(600, 60 + len(df) * 36),
         hide_index=True,
     )
@@ -373,6 +447,10 @@ def render_all(df: pd.DataFrame):
 # MAIN APP
 # -----------------------------------------------------------------
 def main():
+    # Streamlit drops any element a rerun doesn't emit, so the stylesheet has
+    # to go out every run; only the string itself is built once.
+    st.markdown(_CSS, unsafe_allow_html=True)
+
     if not check_password():
         return
 
@@ -381,26 +459,28 @@ def main():
     if run_btn and adp_file and amazon_file:
         with st.spinner(f"Analyzing break records for station {station}..."):
             try:
-                df          = run_analysis(adp_file, amazon_file)
+                adp_bytes   = adp_file.getvalue()
+                amz_bytes   = amazon_file.getvalue()
+                df          = _cached_run_analysis(adp_bytes, amz_bytes, adp_file.name, amazon_file.name)
                 report_date = infer_date(adp_file.name, amazon_file.name)
+                digest      = hashlib.blake2b(adp_bytes, digest_size=16)
+                digest.update(amz_bytes)
                 st.session_state.update({
                     "results":     df,
+                    "results_key": digest.hexdigest(),
+                    "issues":      df[df["needs_action"]].reset_index(drop=True),
                     "report_date": report_date,
                     "station":     station,
                     "adp_name":    adp_file.name,
                     "amz_name":    amazon_file.name,
                 })
+                st.session_state.pop("scripts_page", None)
             except Exception as e:
                 st.error(f"Analysis failed: {e}")
                 return
 
     if "results" not in st.session_state:
-        st.markdown("""
-        <div class="page-header">
-          <h1>MLM Break Time Tracker</h1>
-          <p>Upload the ADP and Amazon files in the sidebar, confirm the station, then click <strong>Run Analysis</strong>.</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_WELCOME_HEADER_HTML, unsafe_allow_html=True)
 
         c1, c2, c3 = st.columns(3)
         c1.info("**Step 1:** Upload both files in the sidebar")
@@ -409,38 +489,29 @@ def main():
 
         st.markdown("---")
         st.markdown("#### Recommended Folder Structure")
-        st.markdown("""
-        <div class="folder-tip">
-        Save your daily downloaded reports to the matching station folder on your computer:<br><br>
-        <code>MLM / DFH1 / Reports / Break_Discrepancy_Report_DFH1_February-18-2026.xlsx</code><br>
-        <code>MLM / DVB8 / Reports / Break_Discrepancy_Report_DVB8_February-18-2026.xlsx</code>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_FOLDER_STRUCTURE_HTML, unsafe_allow_html=True)
         return
 
     df          = st.session_state["results"]
     report_date = st.session_state.get("report_date", "")
     station     = st.session_state.get("station", "")
-    disc_count  = int(df["needs_action"].sum())
+    issues      = st.session_state["issues"]
+    disc_count  = len(issues)
 
-    st.markdown(f"""
-    <div class="page-header">
-      <h1>Break Time Discrepancy Report
-        <span class="station-badge">{station}</span>
-      </h1>
-      <p>{report_date}  -
-         <strong style="color:#E87722;">{disc_count} employee{"s" if disc_count != 1 else ""}
-         need{"" if disc_count != 1 else "s"} correction before 5 PM</strong>
-      </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_REPORT_HEADER_TMPL.format(
+        station=station,
+        report_date=report_date,
+        disc_count=disc_count,
+        plural="s" if disc_count != 1 else "",
+        verb_s="" if disc_count != 1 else "s",
+    ), unsafe_allow_html=True)
 
     render_metrics(df)
 
     col_dl, col_tip = st.columns([2, 5])
     with col_dl:
         safe_date    = report_date.replace(" ", "-").replace(",", "")
-        excel_bytes  = export_excel(df, report_date, station)
+        excel_bytes  = _cached_export_excel(df, st.session_state["results_key"], report_date, station)
         filename     = f"Break_Discrepancy_Report_{station}_{safe_date}.xlsx"
         st.download_button(
             label="Download Excel Report",
@@ -451,8 +522,7 @@ def main():
         )
     with col_tip:
         st.markdown(
-            f'<div class="folder-tip">Save this report to: '
-            f'<code>MLM / {station} / Reports / {filename}</code></div>',
+            _SAVE_TIP_TMPL.format(station=station, filename=filename),
             unsafe_allow_html=True,
         )
 
@@ -463,8 +533,8 @@ def main():
         "5 PM Scripts",
         f"All Employees ({len(df)})",
     ])
-    with tab1: render_table(df)
-    with tab2: render_scripts(df)
+    with tab1: render_table(issues)
+    with tab2: render_scripts(issues)
     with tab3: render_all(df)
 
 
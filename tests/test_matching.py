@@ -0,0 +1,64 @@
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from analysis import _name_tokens, _score_rows  # noqa: E402
+
+
+# Pairwise definition of the name score that _score_rows computes in bulk.
+def _token_matches(ta: frozenset, tb: frozenset) -> int:
+    hits = len(ta & tb)
+    tb_big = [b for b in tb if len(b) >= 3]
+    for a in ta - tb:
+        if len(a) >= 3 and any(a in b or b in a for b in tb_big):
+            hits += 1
+    return hits
+
+
+def _overlap_score(name_a: str, name_b: str) -> float:
+    if str(name_a).strip().lower() == str(name_b).strip().lower():
+        return 1.0
+    ta, tb = _name_tokens(name_a), _name_tokens(name_b)
+    if not ta or not tb:
+        return 0.0
+    return _token_matches(ta, tb) / max(len(ta), len(tb))
+
+
+def _random_name(rnd: random.Random) -> str:
+    words = ["".join(rnd.choice("abcdeilmnorst") for _ in range(rnd.randint(1, 7)))
+             for _ in range(rnd.randint(0, 3))]
+    sep = rnd.choice([" ", "", "-", "  "])
+    name = sep.join(w.title() if rnd.random() < 0.7 else w for w in words)
+    return name + rnd.choice(["", "", " Jr", "2", " ."])
+
+
+def _check(adp_names, amz_names):
+    got = list(_score_rows(adp_names, amz_names))
+    assert len(got) == len(adp_names)
+    for name, row in zip(adp_names, got):
+        expected = [_overlap_score(name, other) for other in amz_names]
+        np.testing.assert_allclose(row, expected, err_msg=name)
+
+
+def test_scores_match_pairwise_definition():
+    rnd = random.Random(0)
+    for _ in range(300):
+        adp = [_random_name(rnd) for _ in range(rnd.randint(0, 12))]
+        amz = [_random_name(rnd) for _ in range(rnd.randint(0, 12))]
+        # Share some names so exact and near-exact matches get exercised.
+        amz += rnd.sample(adp, min(len(adp), 3))
+        _check(adp, amz)
+
+
+def test_identical_names_without_tokens_score_one():
+    _check(["J K", " . ", "O'Neil"], ["j k", "X Y", " . ", "ONeil", "o'neil "])
+
+
+def test_short_fragments_only_match_exactly():
+    rows = list(_score_rows(["Al Jr"], ["Alan Jrson", "Al Smith"]))
+    np.testing.assert_allclose(rows[0], [0.0, 0.5])
+